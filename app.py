@@ -1,9 +1,80 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
 from portfolio_optimizer import PortfolioOptimizer
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to Flask's encoder
+    orjson = None
 
 app = Flask(__name__)
 
+class RequestValidationError(ValueError):
+    """Invalid request field; the message is returned to the client as-is"""
+
+def _json_response(result):
+    """Serialize a successful result, using orjson when it is installed"""
+    if orjson is None:
+        return jsonify(result)
+    return Response(
+        orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY),
+        mimetype='application/json'
+    )
+
+@lru_cache(maxsize=1024)
+def _parse(tickers_str, start_str, end_str, risk_free_rate, today):
+    """
+    Parse and validate the fields shared by the optimization endpoints
+    
+    Parameters:
+        tickers_str (str): Comma-separated ticker symbols
+        start_str (str): Start date (YYYY-MM-DD), empty for one year before end date
+        end_str (str): End date (YYYY-MM-DD), empty for today
+        risk_free_rate: Annual risk-free rate
+        today (str): Today's date (YYYY-MM-DD); part of the cache key so defaults stay current
+        
+    Returns:
+        tuple: (tickers, start_date, end_date, risk_free_rate) with dates as YYYY-MM-DD strings
+        
+    Raises:
+        RequestValidationError: If the tickers or date range are invalid
+        ValueError: If a date or the risk-free rate cannot be parsed
+    """
+    # Parse tickers, dropping blanks and duplicates while keeping order
+    tickers = tuple(dict.fromkeys(t.strip().upper() for t in tickers_str.split(',') if t.strip()))
+    if len(tickers) < 2:
+        raise RequestValidationError('Please enter at least 2 ticker symbols')
+    
+    # Use date range from request or default to last year
+    end_date = datetime.strptime(end_str or today, '%Y-%m-%d')
+    start_date = end_date - timedelta(days=365)
+    if start_str:
+        start_date = datetime.strptime(start_str, '%Y-%m-%d')
+    
+    # Validate date range
+    if start_date >= end_date:
+        raise RequestValidationError('Start date must be before end date')
+    
+    return (
+        tickers,
+        start_date.strftime('%Y-%m-%d'),
+        end_date.strftime('%Y-%m-%d'),
+        float(risk_free_rate)
+    )
+
+def _parse_request(data):
+    """Validate a request body with _parse, returning (tickers, start, end, risk_free_rate)"""
+    tickers, start_date, end_date, risk_free_rate = _parse(
+        data['tickers'],
+        data.get('start_date') or '',
+        data.get('end_date') or '',
+        data.get('risk_free_rate', 0.02),
+        datetime.now().strftime('%Y-%m-%d')
+    )
+    return list(tickers), start_date, end_date, risk_free_rate
+
 @app.route('/')
 def index():
     """Render the main page"""
@@ -19,33 +90,16 @@ def optimize():
     try:
         data = request.json
         
-        # Parse and validate tickers
-        tickers = [t.strip().upper() for t in data['tickers'].split(',')]
-        if len(tickers) < 2:
-            return jsonify({'error': 'Please enter at least 2 ticker symbols'}), 400
+        # Parse and validate tickers, dates and risk-free rate
+        tickers, start_date, end_date, risk_free_rate = _parse_request(data)
         
         optimization_type = data.get('optimization_type', 'sharpe')
         
-        # Use date range from request or default to last year
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=365)
-        
-        if 'start_date' in data and data['start_date']:
-            start_date = datetime.strptime(data['start_date'], '%Y-%m-%d')
-        if 'end_date' in data and data['end_date']:
-            end_date = datetime.strptime(data['end_date'], '%Y-%m-%d')
-        
-        # Validate date range
-        if start_date >= end_date:
-            return jsonify({'error': 'Start date must be before end date'}), 400
-        
-        risk_free_rate = float(data.get('risk_free_rate', 0.02))
-        
         # Initialize optimizer
         optimizer = PortfolioOptimizer(
             tickers=tickers,
-            start_date=start_date.strftime('%Y-%m-%d'),
-            end_date=end_date.strftime('%Y-%m-%d'),
+            start_date=start_date,
+            end_date=end_date,
             risk_free_rate=risk_free_rate
         )
         
@@ -76,8 +130,10 @@ def optimize():
         # Add tickers to result
         result['tickers'] = tickers
         
-        return jsonify(result)
+        return _json_response(result)
     
+    except RequestValidationError as e:
+        return jsonify({'error': str(e)}), 400
     except ValueError as e:
         return jsonify({'error': f'Invalid input: {str(e)}'}), 400
     except Exception as e:
@@ -92,31 +148,14 @@ def efficient_frontier():
     try:
         data = request.json
         
-        # Parse and validate tickers
-        tickers = [t.strip().upper() for t in data['tickers'].split(',')]
-        if len(tickers) < 2:
-            return jsonify({'error': 'Please enter at least 2 ticker symbols'}), 400
-        
-        # Use date range from request or default to last year
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=365)
-        
-        if 'start_date' in data and data['start_date']:
-            start_date = datetime.strptime(data['start_date'], '%Y-%m-%d')
-        if 'end_date' in data and data['end_date']:
-            end_date = datetime.strptime(data['end_date'], '%Y-%m-%d')
-        
-        # Validate date range
-        if start_date >= end_date:
-            return jsonify({'error': 'Start date must be before end date'}), 400
-        
-        risk_free_rate = float(data.get('risk_free_rate', 0.02))
+        # Parse and validate tickers, dates and risk-free rate
+        tickers, start_date, end_date, risk_free_rate = _parse_request(data)
         
         # Initialize optimizer
         optimizer = PortfolioOptimizer(
             tickers=tickers,
-            start_date=start_date.strftime('%Y-%m-%d'),
-            end_date=end_date.strftime('%Y-%m-%d'),
+            start_date=start_date,
+            end_date=end_date,
             risk_free_rate=risk_free_rate
         )
         
@@ -133,25 +172,35 @@ def efficient_frontier():
             details = getattr(optimizer, 'last_error', None)
             return jsonify({'error': 'No valid data available for the selected tickers and date range.', 'details': details}), 400
         
-        # Generate efficient frontier
-        frontier = optimizer.efficient_frontier(num_portfolios=500)
-        
-        # Get optimal portfolios
-        sharpe_opt = optimizer.optimize_sharpe()
+        # The minimum variance portfolio anchors the frontier, so solve it once up front
         min_var_opt = optimizer.optimize_min_variance()
         
+        # Generate efficient frontier and max Sharpe portfolio concurrently
+        # (NumPy/SciPy release the GIL inside their native solvers)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            frontier_future = executor.submit(optimizer.efficient_frontier, 50, min_var_opt)
+            sharpe_future = executor.submit(optimizer.optimize_sharpe)
+            frontier = frontier_future.result()
+            sharpe_opt = sharpe_future.result()
+        
         if not sharpe_opt['success'] or not min_var_opt['success']:
             return jsonify({'error': 'Failed to compute optimal portfolios'}), 400
         
+        # Random portfolios plotted as a cloud behind the frontier line
+        random_portfolios = optimizer.random_portfolios(num_portfolios=300)
+        
         result = {
             'frontier': frontier,
+            'random_portfolios': random_portfolios,
             'optimal_sharpe': sharpe_opt,
             'optimal_min_variance': min_var_opt,
             'tickers': tickers
         }
         
-        return jsonify(result)
+        return _json_response(result)
     
+    except RequestValidationError as e:
+        return jsonify({'error': str(e)}), 400
     except ValueError as e:
         return jsonify({'error': f'Invalid input: {str(e)}'}), 400
     except Exception as e:
@@ -8,9 +8,151 @@ import pandas as pd
 from scipy.optimize import minimize
 import yfinance as yf
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import math
+import os
+import tempfile
+import threading
+import time
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain NumPy
+    njit = None
+
+try:
+    import osqp
+    from scipy import sparse
+except ImportError:  # osqp is optional; fall back to SLSQP
+    osqp = None
+
+try:
+    from sklearn.covariance import LedoitWolf
+except ImportError:  # scikit-learn is only needed for cov_estimator='ledoit_wolf'
+    LedoitWolf = None
+
+# Directory for on-disk copies of yfinance downloads
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.yf_cache')
+
+# Seconds before a cached download is considered stale and fetched again
+CACHE_TTL = 12 * 60 * 60
+
+# Maximum number of symbols sent to Yahoo Finance in one request
+DOWNLOAD_BATCH_SIZE = 20
+
+# Supported covariance estimators
+COV_ESTIMATORS = ('sample', 'ledoit_wolf')
+
+# Shared random generator (PCG64) for Monte Carlo sampling and optimizer starts
+_RNG = np.random.default_rng()
+
+# One long-lived HTTP session so yfinance reuses pooled keep-alive connections.
+# Recent yfinance releases require a curl_cffi session; older ones accept requests.
+try:
+    from curl_cffi import requests as _http
+    _YF_SESSION = _http.Session(impersonate='chrome')
+except ImportError:
+    import requests as _http
+    _YF_SESSION = _http.Session()
+
+
+def _download_prices(tickers, start_date, end_date):
+    """
+    Download price history from Yahoo Finance, reusing an on-disk copy when available
+    
+    Parameters:
+        tickers (list): List of stock ticker symbols
+        start_date (str): Start date for historical data
+        end_date (str): End date for historical data
+        
+    Returns:
+        DataFrame: Raw frame as returned by yf.download, with adjusted 'Close' prices
+    """
+    key = repr((tuple(sorted(tickers)), start_date, end_date, 'auto_adjust'))
+    path = os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + '.pkl')
+    
+    try:
+        if time.time() - os.path.getmtime(path) < CACHE_TTL:
+            return pd.read_pickle(path)
+    except Exception:
+        # Missing, corrupt or incompatible cache entry: download again
+        pass
+    
+    # Fetch symbols concurrently, in batches Yahoo will accept in one request
+    frames = []
+    for i in range(0, len(tickers), DOWNLOAD_BATCH_SIZE):
+        frame = yf.download(
+            tickers[i:i + DOWNLOAD_BATCH_SIZE],
+            start=start_date,
+            end=end_date,
+            progress=False,
+            threads=True,
+            auto_adjust=True,
+            group_by='column',
+            session=_YF_SESSION
+        )
+        if not frame.empty:
+            frames.append(frame)
+    
+    if not frames:
+        return pd.DataFrame()
+    raw = frames[0] if len(frames) == 1 else pd.concat(frames, axis=1)
+    
+    # Only cache complete downloads: yfinance returns an all-NaN column for a failed symbol
+    closes = raw['Close'] if 'Close' in raw.columns.get_level_values(0) else pd.DataFrame()
+    if isinstance(closes, pd.Series):
+        closes = closes.to_frame(name=tickers[0])
+    complete = all(t in closes.columns and closes[t].notna().any() for t in tickers)
+    
+    if complete:
+        # Write to a unique temp file so readers never see a partial pickle; the cache
+        # is best effort, so a read-only or full disk must not fail the download
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    raw.to_pickle(f)
+                os.replace(tmp_path, path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            print(f"Could not cache price data: {e}")
+    
+    return raw
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _portfolio_stats_kernel(weights, mean_returns, chol_factor, risk_free_rate):
+        """Compiled (return, volatility, Sharpe) kernel used by portfolio_stats"""
+        n = weights.size
+        portfolio_return = 0.0
+        for i in range(n):
+            portfolio_return += mean_returns[i] * weights[i]
+        
+        # w.C.w = |L^T w|^2, touching only the lower triangle of L
+        variance = 0.0
+        for j in range(n):
+            v = 0.0
+            for i in range(j, n):
+                v += chol_factor[i, j] * weights[i]
+            variance += v * v
+        
+        portfolio_std = math.sqrt(variance)
+        return portfolio_return, portfolio_std, (portfolio_return - risk_free_rate) / portfolio_std
+else:
+    def _portfolio_stats_kernel(weights, mean_returns, chol_factor, risk_free_rate):
+        """NumPy (return, volatility, Sharpe) kernel used by portfolio_stats"""
+        portfolio_return = mean_returns @ weights
+        portfolio_std = np.linalg.norm(chol_factor.T @ weights)
+        return portfolio_return, portfolio_std, (portfolio_return - risk_free_rate) / portfolio_std
+
+
 class PortfolioOptimizer:
     """
     A class to optimize financial portfolios using Modern Portfolio Theory
@@ -20,12 +162,13 @@ class PortfolioOptimizer:
         start_date (str): Start date for historical data (YYYY-MM-DD)
         end_date (str): End date for historical data (YYYY-MM-DD)
         risk_free_rate (float): Annual risk-free rate (default: 0.02 or 2%)
-        returns (DataFrame): Daily returns for each asset
+        cov_estimator (str): Covariance estimator, 'sample' or 'ledoit_wolf'
+        returns (DataFrame): Daily log returns for each asset
         mean_returns (Series): Annualized mean returns
         cov_matrix (DataFrame): Annualized covariance matrix
     """
     
-    def __init__(self, tickers, start_date, end_date, risk_free_rate=0.02):
+    def __init__(self, tickers, start_date, end_date, risk_free_rate=0.02, cov_estimator='sample'):
         """
         Initialize the Portfolio Optimizer
         
@@ -34,32 +177,41 @@ class PortfolioOptimizer:
             start_date (str): Start date for historical data
             end_date (str): End date for historical data
             risk_free_rate (float): Annual risk-free rate (default: 2%)
+            cov_estimator (str): 'sample' covariance or 'ledoit_wolf' shrinkage (default: 'sample')
         """
+        if cov_estimator not in COV_ESTIMATORS:
+            raise ValueError(f"cov_estimator must be one of {', '.join(COV_ESTIMATORS)}")
+        
         self.tickers = tickers
         self.start_date = start_date
         self.end_date = end_date
         self.risk_free_rate = risk_free_rate
+        self.cov_estimator = cov_estimator
         self.returns = None
+        self._returns_np = None
         self.mean_returns = None
         self.cov_matrix = None
+        # Contiguous NumPy copies of mean_returns / cov_matrix for the optimizer hot path
+        self._mu_np = None
+        self._cov_np = None
+        # Lower Cholesky factor of cov_matrix (C = L L^T)
+        self._chol_L = None
+        # OSQP solvers set up per problem, reused across repeated solves
+        self._qp_solvers = {}
+        self._qp_lock = threading.Lock()
         # Store last error message for better API responses / debugging
         self.last_error = None
         
     def fetch_data(self):
         """
-        Fetch historical price data from Yahoo Finance and calculate returns
+        Fetch historical price data from Yahoo Finance and calculate log returns
         
         Returns:
             bool: True if data was successfully fetched, False otherwise
         """
         try:
-            # Download historical prices
-            raw = yf.download(
-                self.tickers,
-                start=self.start_date,
-                end=self.end_date,
-                progress=False
-            )
+            # Download historical prices (cached on disk per tickers/date range)
+            raw = _download_prices(self.tickers, self.start_date, self.end_date)
 
             # If no data returned, bail out early
             if raw.empty:
@@ -67,33 +219,12 @@ class PortfolioOptimizer:
                 print(self.last_error)
                 return False
 
-            # Extract adjusted close prices robustly to handle different yf shapes
-            try:
-                data = raw['Adj Close']
-            except Exception:
-                # MultiIndex (e.g., columns like ('Adj Close', 'AAPL')) or only 'Close' available
-                if isinstance(raw.columns, pd.MultiIndex):
-                    # Try selecting the 'Adj Close' level
-                    try:
-                        data = raw.loc[:, ('Adj Close', slice(None))]
-                    except Exception:
-                        # fallback to Close
-                        if 'Close' in raw.columns.get_level_values(0):
-                            data = raw.loc[:, ('Close', slice(None))]
-                        else:
-                            self.last_error = f"Adj Close column not found. Columns: {raw.columns.tolist()}"
-                            print(self.last_error)
-                            return False
-                else:
-                    # Single-level columns: try 'Close' or assume raw itself is the price series
-                    if 'Close' in raw.columns:
-                        data = raw['Close']
-                    elif isinstance(raw, pd.Series):
-                        data = raw
-                    else:
-                        self.last_error = f"Adj Close column not found. Columns: {raw.columns.tolist()}"
-                        print(self.last_error)
-                        return False
+            # Prices are downloaded with auto_adjust, so 'Close' is already adjusted
+            if 'Close' not in raw.columns.get_level_values(0):
+                self.last_error = f"Close column not found. Columns: {raw.columns.tolist()}"
+                print(self.last_error)
+                return False
+            data = raw['Close']
 
             # Handle single ticker case: ensure DataFrame with ticker as column
             if len(self.tickers) == 1:
@@ -103,26 +234,63 @@ class PortfolioOptimizer:
                     # rename columns to the expected ticker if shapes mismatch
                     data.columns = self.tickers
             
+            # Order columns like self.tickers so weights line up with the requested symbols
+            missing = [t for t in self.tickers if t not in data.columns]
+            if missing:
+                self.last_error = f"No price data for: {', '.join(missing)}"
+                print(self.last_error)
+                return False
+            data = data[self.tickers]
+            
             # Check if data is empty
             if data.empty:
                 self.last_error = "No data available for the specified tickers and date range"
                 print(self.last_error)
                 return False
             
-            # Calculate daily returns
-            self.returns = data.pct_change().dropna()
+            # Calculate daily log returns in NumPy, skipping days with missing prices
+            prices = data.to_numpy(dtype=np.float64, copy=False)
+            complete_rows = ~np.isnan(prices).any(axis=1)
+            log_returns = np.diff(np.log(prices[complete_rows]), axis=0)
+            self._returns_np = log_returns
+            self.returns = pd.DataFrame(
+                log_returns, index=data.index[complete_rows][1:], columns=data.columns
+            )
             
             # Check if we have enough data points
-            if len(self.returns) < 30:
+            if len(log_returns) < 30:
                 self.last_error = "Insufficient data points. Need at least 30 days of data."
                 print(self.last_error)
                 return False
             
             # Calculate annualized mean returns (252 trading days per year)
-            self.mean_returns = self.returns.mean() * 252
+            self._mu_np = log_returns.mean(axis=0) * 252
             
             # Calculate annualized covariance matrix
-            self.cov_matrix = self.returns.cov() * 252
+            if self.cov_estimator == 'ledoit_wolf':
+                # Shrinkage keeps the matrix well conditioned when history is short
+                if LedoitWolf is None:
+                    self.last_error = "scikit-learn is required for the Ledoit-Wolf covariance estimator"
+                    print(self.last_error)
+                    return False
+                self._cov_np = LedoitWolf().fit(log_returns).covariance_ * 252
+            else:
+                self._cov_np = np.atleast_2d(np.cov(log_returns, rowvar=False)) * 252
+            self._qp_solvers = {}
+            
+            # Factor the covariance once; add a tiny ridge if it is only semi-definite
+            try:
+                self._chol_L = np.linalg.cholesky(self._cov_np)
+            except np.linalg.LinAlgError:
+                ridge = 1e-10 * np.trace(self._cov_np) / len(self._cov_np)
+                self._chol_L = np.linalg.cholesky(self._cov_np + ridge * np.eye(len(self._cov_np)))
+            
+            # Keep labelled views for callers that want pandas objects
+            self.mean_returns = pd.Series(self._mu_np, index=data.columns)
+            self.cov_matrix = pd.DataFrame(self._cov_np, index=data.columns, columns=data.columns)
+            
+            # Warm up the stats kernel so JIT compilation isn't paid by the first optimization
+            self.portfolio_stats(np.full(len(self._mu_np), 1.0 / len(self._mu_np)))
             
             # Clear last error and return success
             self.last_error = None
@@ -143,19 +311,12 @@ class PortfolioOptimizer:
         Returns:
             tuple: (portfolio_return, portfolio_std, sharpe_ratio)
         """
-        # Ensure weights are a numpy array
-        weights = np.array(weights)
-        
-        # Calculate portfolio return
-        portfolio_return = np.sum(self.mean_returns * weights)
-        
-        # Calculate portfolio standard deviation (volatility)
-        portfolio_std = np.sqrt(np.dot(weights.T, np.dot(self.cov_matrix, weights)))
+        # Ensure weights are a contiguous float64 numpy array for the kernel
+        weights = np.ascontiguousarray(weights, dtype=np.float64)
         
-        # Calculate Sharpe ratio
-        sharpe_ratio = (portfolio_return - self.risk_free_rate) / portfolio_std
-        
-        return portfolio_return, portfolio_std, sharpe_ratio
+        return _portfolio_stats_kernel(
+            weights, self._mu_np, self._chol_L, float(self.risk_free_rate)
+        )
     
     def negative_sharpe(self, weights):
         """
@@ -169,50 +330,184 @@ class PortfolioOptimizer:
         """
         return -self.portfolio_stats(weights)[2]
     
-    def optimize_sharpe(self):
+    def negative_sharpe_jac(self, weights):
         """
-        Optimize portfolio to maximize Sharpe ratio
+        Calculate the gradient of the negative Sharpe ratio
         
+        Parameters:
+            weights (array): Portfolio weights
+            
         Returns:
-            dict: Optimization results including weights, return, volatility, and Sharpe ratio
+            array: Gradient of negative Sharpe ratio with respect to the weights
         """
-        num_assets = len(self.tickers)
+        weights = np.asarray(weights, dtype=np.float64)
+        cov_weights = self._cov_np @ weights
+        portfolio_std = math.sqrt(weights @ cov_weights)
+        excess_return = self._mu_np @ weights - self.risk_free_rate
+        
+        # Quotient rule on (mu.w - rf) / sqrt(w.C.w)
+        d_std = cov_weights / portfolio_std
+        d_sharpe = (self._mu_np * portfolio_std - excess_return * d_std) / (portfolio_std * portfolio_std)
+        return -d_sharpe
+    
+    def _solve_qp(self, name, budget_row, upper_bound):
+        """
+        Minimize x.C.x subject to budget_row.x = 1 and 0 <= x <= upper_bound with OSQP
         
-        # Constraints: weights must sum to 1
-        constraints = {'type': 'eq', 'fun': lambda x: np.sum(x) - 1}
+        The solver is set up once per problem name and warm-started on later calls.
         
-        # Bounds: weights between 0 and 1 (no short selling allowed)
-        bounds = tuple((0, 1) for _ in range(num_assets))
+        Parameters:
+            name (str): Cache key for the solver instance
+            budget_row (array): Coefficients of the equality constraint
+            upper_bound (float): Upper bound for every component of x
+            
+        Returns:
+            array: Optimal x, or None if OSQP is unavailable or did not solve the problem
+        """
+        if osqp is None:
+            return None
         
-        # Initial guess: equal weights
-        init_guess = num_assets * [1.0 / num_assets]
+        # OSQP solver objects are stateful, so concurrent solves are serialized
+        with self._qp_lock:
+            solver = self._qp_solvers.get(name)
+            if solver is None:
+                num_assets = len(budget_row)
+                constraint_matrix = sparse.vstack(
+                    [sparse.csc_matrix(budget_row), sparse.identity(num_assets)], format='csc'
+                )
+                solver = osqp.OSQP()
+                solver.setup(
+                    P=sparse.triu(sparse.csc_matrix(self._cov_np), format='csc'),
+                    q=np.zeros(num_assets),
+                    A=constraint_matrix,
+                    l=np.concatenate(([1.0], np.zeros(num_assets))),
+                    u=np.concatenate(([1.0], np.full(num_assets, upper_bound))),
+                    eps_abs=1e-9,
+                    eps_rel=1e-9,
+                    polish=True,
+                    verbose=False
+                )
+                self._qp_solvers[name] = solver
+            
+            result = solver.solve()
+            if result.info.status != 'solved':
+                return None
+            return np.clip(result.x, 0.0, None)
+    
+    def _two_asset_min_variance(self):
+        """
+        Closed-form long-only minimum variance weights for two assets
         
-        # Perform optimization using Sequential Least Squares Programming
-        result = minimize(
-            self.negative_sharpe,
-            init_guess,
-            method='SLSQP',
-            bounds=bounds,
-            constraints=constraints,
-            options={'maxiter': 1000}
-        )
+        Returns:
+            array: Optimal weights, or None if both assets are interchangeable
+        """
+        cov = self._cov_np
+        denominator = cov[0, 0] + cov[1, 1] - 2.0 * cov[0, 1]
+        if denominator <= 0:
+            return None
         
-        if result.success:
-            optimal_weights = result.x
-            ret, std, sharpe = self.portfolio_stats(optimal_weights)
+        w1 = min(max((cov[1, 1] - cov[0, 1]) / denominator, 0.0), 1.0)
+        return np.array([w1, 1.0 - w1])
+    
+    def _two_asset_sharpe(self):
+        """
+        Closed-form long-only maximum Sharpe weights for two assets
+        
+        The Sharpe ratio along w1 + w2 = 1 has a single interior stationary point
+        (the tangency portfolio), so the optimum is either that point or a corner.
+        
+        Returns:
+            array: Optimal weights
+        """
+        cov = self._cov_np
+        excess = self._mu_np - self.risk_free_rate
+        
+        candidates = [np.array([1.0, 0.0]), np.array([0.0, 1.0])]
+        
+        # Tangency portfolio: proportional to C^-1 (mu - rf)
+        y0 = cov[1, 1] * excess[0] - cov[0, 1] * excess[1]
+        y1 = cov[0, 0] * excess[1] - cov[0, 1] * excess[0]
+        if y0 + y1 != 0:
+            w1 = y0 / (y0 + y1)
+            if 0.0 < w1 < 1.0:
+                candidates.append(np.array([w1, 1.0 - w1]))
+        
+        return max(candidates, key=lambda w: self.portfolio_stats(w)[2])
+    
+    def optimize_sharpe(self):
+        """
+        Optimize portfolio to maximize Sharpe ratio
+        
+        Returns:
+            dict: Optimization results including weights, return, volatility, and Sharpe ratio
+        """
+        num_assets = len(self.tickers)
+        optimal_weights = None
+        
+        # Two assets have a closed-form solution; skip the solvers entirely
+        if num_assets == 2:
+            optimal_weights = self._two_asset_sharpe()
+        
+        # Convex reformulation (Cornuejols-Tutuncu): minimize y.C.y subject to
+        # (mu - rf).y = 1, y >= 0, then w = y / sum(y). Only valid when some
+        # asset has a positive excess return.
+        excess_returns = self._mu_np - self.risk_free_rate
+        if optimal_weights is None and excess_returns.max() > 0:
+            scaled_weights = self._solve_qp('sharpe', excess_returns, np.inf)
+            if scaled_weights is not None and scaled_weights.sum() > 0:
+                optimal_weights = scaled_weights / scaled_weights.sum()
+        
+        if optimal_weights is None:
+            # Constraints: weights must sum to 1
+            constraints = {'type': 'eq', 'fun': lambda x: np.sum(x) - 1, 'jac': lambda x: np.ones_like(x)}
             
-            return {
-                'weights': optimal_weights.tolist(),
-                'return': float(ret),
-                'volatility': float(std),
-                'sharpe_ratio': float(sharpe),
-                'success': True
-            }
-        else:
-            return {
-                'success': False, 
-                'message': 'Optimization failed to converge'
-            }
+            # Bounds: weights between 0 and 1 (no short selling allowed)
+            bounds = tuple((0, 1) for _ in range(num_assets))
+            
+            # Initial guesses: equal weights, inverse variance, the highest-return
+            # asset, and a few random points on the simplex
+            inverse_variance = 1.0 / np.diag(self._cov_np)
+            max_return_asset = np.zeros(num_assets)
+            max_return_asset[np.argmax(self._mu_np)] = 1.0
+            init_guesses = [
+                np.full(num_assets, 1.0 / num_assets),
+                inverse_variance / inverse_variance.sum(),
+                max_return_asset,
+                *_RNG.dirichlet(np.ones(num_assets), size=3)
+            ]
+            
+            # Perform optimization using Sequential Least Squares Programming
+            def solve(init_guess):
+                return minimize(
+                    self.negative_sharpe,
+                    init_guess,
+                    method='SLSQP',
+                    jac=self.negative_sharpe_jac,
+                    bounds=bounds,
+                    constraints=constraints,
+                    options={'maxiter': 200}
+                )
+            
+            # Run every start concurrently and keep the best converged solution
+            with ThreadPoolExecutor(max_workers=len(init_guesses)) as executor:
+                results = [r for r in executor.map(solve, init_guesses) if r.success]
+            
+            if not results:
+                return {
+                    'success': False, 
+                    'message': 'Optimization failed to converge'
+                }
+            optimal_weights = min(results, key=lambda r: r.fun).x
+        
+        ret, std, sharpe = self.portfolio_stats(optimal_weights)
+        
+        return {
+            'weights': optimal_weights.tolist(),
+            'return': float(ret),
+            'volatility': float(std),
+            'sharpe_ratio': float(sharpe),
+            'success': True
+        }
     
     def optimize_min_variance(self):
         """
@@ -222,46 +517,61 @@ class PortfolioOptimizer:
             dict: Optimization results including weights, return, volatility, and Sharpe ratio
         """
         num_assets = len(self.tickers)
+        optimal_weights = None
         
-        # Objective function: minimize portfolio variance
-        def portfolio_variance(weights):
-            return np.dot(weights.T, np.dot(self.cov_matrix, weights))
+        # Two assets have a closed-form solution; skip the solvers entirely
+        if num_assets == 2:
+            optimal_weights = self._two_asset_min_variance()
         
-        # Constraints: weights must sum to 1
-        constraints = {'type': 'eq', 'fun': lambda x: np.sum(x) - 1}
+        # Min variance is a convex QP: solve it directly when OSQP is available
+        if optimal_weights is None:
+            optimal_weights = self._solve_qp('min_variance', np.ones(num_assets), 1.0)
         
-        # Bounds: weights between 0 and 1
-        bounds = tuple((0, 1) for _ in range(num_assets))
-        
-        # Initial guess: equal weights
-        init_guess = num_assets * [1.0 / num_assets]
+        if optimal_weights is None:
+            # Objective function: minimize portfolio variance
+            def portfolio_variance(weights):
+                return weights @ self._cov_np @ weights
+            
+            # Gradient of the variance: 2 C w
+            def portfolio_variance_jac(weights):
+                return 2.0 * (self._cov_np @ weights)
+            
+            # Constraints: weights must sum to 1
+            constraints = {'type': 'eq', 'fun': lambda x: np.sum(x) - 1, 'jac': lambda x: np.ones_like(x)}
+            
+            # Bounds: weights between 0 and 1
+            bounds = tuple((0, 1) for _ in range(num_assets))
+            
+            # Initial guess: equal weights
+            init_guess = num_assets * [1.0 / num_assets]
+            
+            # Perform optimization
+            result = minimize(
+                portfolio_variance,
+                init_guess,
+                method='SLSQP',
+                jac=portfolio_variance_jac,
+                bounds=bounds,
+                constraints=constraints,
+                options={'maxiter': 1000}
+            )
+            
+            if not result.success:
+                return {
+                    'success': False, 
+                    'message': 'Optimization failed to converge'
+                }
+            optimal_weights = result.x
         
-        # Perform optimization
-        result = minimize(
-            portfolio_variance,
-            init_guess,
-            method='SLSQP',
-            bounds=bounds,
-            constraints=constraints,
-            options={'maxiter': 1000}
-        )
+        ret, std, sharpe = self.portfolio_stats(optimal_weights)
         
-        if result.success:
-            optimal_weights = result.x
-            ret, std, sharpe = self.portfolio_stats(optimal_weights)
-            
-            return {
-                'weights': optimal_weights.tolist(),
-                'return': float(ret),
-                'volatility': float(std),
-                'sharpe_ratio': float(sharpe),
-                'success': True
-            }
-        else:
-            return {
-                'success': False, 
-                'message': 'Optimization failed to converge'
-            }
+        return {
+            'weights': optimal_weights.tolist(),
+            'return': float(ret),
+            'volatility': float(std),
+            'sharpe_ratio': float(sharpe),
+            'success': True
+        }
     
     def optimize_target_return(self, target_return):
         """
@@ -274,14 +584,20 @@ class PortfolioOptimizer:
             dict: Optimization results
         """
         num_assets = len(self.tickers)
+        mu = self._mu_np
+        cov = self._cov_np
         
         def portfolio_variance(weights):
-            return np.dot(weights.T, np.dot(self.cov_matrix, weights))
+            return weights @ cov @ weights
         
-        # Constraints: weights sum to 1 and return equals target
+        # Gradient of the variance: 2 C w
+        def portfolio_variance_jac(weights):
+            return 2.0 * (cov @ weights)
+        
+        # Constraints: weights sum to 1 and return equals target (both linear, constant jacobians)
         constraints = [
-            {'type': 'eq', 'fun': lambda x: np.sum(x) - 1},
-            {'type': 'eq', 'fun': lambda x: np.sum(self.mean_returns * x) - target_return}
+            {'type': 'eq', 'fun': lambda x: np.sum(x) - 1, 'jac': lambda x: np.ones_like(x)},
+            {'type': 'eq', 'fun': lambda x: mu @ x - target_return, 'jac': lambda x: mu}
         ]
         
         bounds = tuple((0, 1) for _ in range(num_assets))
@@ -291,6 +607,7 @@ class PortfolioOptimizer:
             portfolio_variance,
             init_guess,
             method='SLSQP',
+            jac=portfolio_variance_jac,
             bounds=bounds,
             constraints=constraints,
             options={'maxiter': 1000}
@@ -313,40 +630,94 @@ class PortfolioOptimizer:
                 'message': 'Could not achieve target return with given constraints'
             }
     
-    def efficient_frontier(self, num_portfolios=100):
+    def efficient_frontier(self, num_points=50, min_variance=None):
+        """
+        Generate efficient frontier by sweeping target returns
+        
+        Solves the minimum-variance problem for evenly spaced target returns
+        between the minimum variance portfolio and the highest-return asset.
+        
+        Parameters:
+            num_points (int): Number of target returns to solve for
+            min_variance (dict): Result of optimize_min_variance, if already computed
+            
+        Returns:
+            dict: Contains returns, volatilities, Sharpe ratios, and weights along the frontier
+        """
+        # The frontier starts at the minimum variance portfolio...
+        min_var = min_variance if min_variance is not None else self.optimize_min_variance()
+        if min_var['success']:
+            min_return = min_var['return']
+        else:
+            min_return = float(self._mu_np.min())
+        
+        # ...and ends at the single asset with the highest expected return
+        max_return = float(self._mu_np.max())
+        
+        returns, volatilities, sharpe_ratios, weights = [], [], [], []
+        for target in np.linspace(min_return, max_return, num_points):
+            result = self.optimize_target_return(target)
+            if not result['success']:
+                continue
+            
+            returns.append(result['return'])
+            volatilities.append(result['volatility'])
+            sharpe_ratios.append(result['sharpe_ratio'])
+            weights.append(result['weights'])
+        
+        # Round for compact JSON; the extra digits are below plotting resolution
+        return {
+            'returns': np.round(returns, 6).tolist(),
+            'volatilities': np.round(volatilities, 6).tolist(),
+            'sharpe_ratios': np.round(sharpe_ratios, 6).tolist(),
+            'weights': np.round(weights, 4).tolist()
+        }
+    
+    def random_portfolios(self, num_portfolios=100, alpha=None, seed=None):
         """
-        Generate efficient frontier by simulating random portfolios
+        Simulate random long-only portfolios (Monte Carlo)
+        
+        Weights are drawn from a symmetric Dirichlet distribution. By default half
+        the samples use alpha=0.5, which concentrates them near the corners of the
+        simplex where the frontier lies, and half use alpha=2.0 to fill the interior.
         
         Parameters:
             num_portfolios (int): Number of random portfolios to generate
+            alpha (float): Dirichlet concentration for all samples (default: mixed 0.5 / 2.0)
+            seed (int): Seed for reproducible samples (default: shared module generator)
             
         Returns:
             dict: Contains returns, volatilities, Sharpe ratios, and weights for all portfolios
         """
         num_assets = len(self.tickers)
-        results = np.zeros((3, num_portfolios))
-        weights_record = []
         
-        # Generate random portfolios
-        for i in range(num_portfolios):
-            # Generate random weights
-            weights = np.random.random(num_assets)
-            weights /= np.sum(weights)  # Normalize to sum to 1
-            
-            # Calculate portfolio statistics
-            portfolio_return, portfolio_std, sharpe = self.portfolio_stats(weights)
-            
-            # Store results
-            results[0, i] = portfolio_return
-            results[1, i] = portfolio_std
-            results[2, i] = sharpe
-            weights_record.append(weights)
+        # Samples are only plotted, so single precision is plenty and halves memory traffic
+        mu = self._mu_np.astype(np.float32)
+        cov = self._cov_np.astype(np.float32)
+        
+        # Generate all random portfolios at once; Dirichlet samples already sum to 1
+        rng = _RNG if seed is None else np.random.default_rng(seed)
+        if alpha is None:
+            num_corner = num_portfolios // 2
+            weights = np.vstack([
+                rng.dirichlet(np.full(num_assets, 0.5), size=num_corner),
+                rng.dirichlet(np.full(num_assets, 2.0), size=num_portfolios - num_corner)
+            ])
+        else:
+            weights = rng.dirichlet(np.full(num_assets, alpha), size=num_portfolios)
+        weights = weights.astype(np.float32)
+        
+        # Calculate portfolio statistics for the whole batch
+        portfolio_returns = weights @ mu
+        portfolio_stds = np.sqrt(np.einsum('ij,ij->i', weights, weights @ cov))
+        sharpe_ratios = (portfolio_returns - np.float32(self.risk_free_rate)) / portfolio_stds
         
+        # Round for compact JSON; float32 carries no more precision than this anyway
         return {
-            'returns': results[0].tolist(),
-            'volatilities': results[1].tolist(),
-            'sharpe_ratios': results[2].tolist(),
-            'weights': [w.tolist() for w in weights_record]
+            'returns': np.round(portfolio_returns.astype(np.float64), 6).tolist(),
+            'volatilities': np.round(portfolio_stds.astype(np.float64), 6).tolist(),
+            'sharpe_ratios': np.round(sharpe_ratios.astype(np.float64), 6).tolist(),
+            'weights': np.round(weights.astype(np.float64), 4).tolist()
         }
     
     def get_asset_statistics(self):
@@ -359,13 +730,15 @@ class PortfolioOptimizer:
         if self.returns is None:
             return None
         
-        stats = {}
-        for ticker in self.tickers:
-            stats[ticker] = {
-                'return': float(self.mean_returns[ticker]),
-                'volatility': float(self.returns[ticker].std() * np.sqrt(252)),
-                'sharpe': float((self.mean_returns[ticker] - self.risk_free_rate) / 
-                               (self.returns[ticker].std() * np.sqrt(252)))
-            }
+        # Annualized volatility and Sharpe ratio for every asset in one pass
+        volatilities = self._returns_np.std(axis=0, ddof=1) * math.sqrt(252)
+        sharpes = (self._mu_np - self.risk_free_rate) / volatilities
         
-        return stats
\ No newline at end of file
+        return {
+            ticker: {
+                'return': float(self._mu_np[i]),
+                'volatility': float(volatilities[i]),
+                'sharpe': float(sharpes[i])
+            }
+            for i, ticker in enumerate(self.tickers)
+        }
\ No newline at end of file
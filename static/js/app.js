@@ -158,14 +158,32 @@ function displayEfficientFrontier(data) {
     const frontier = data.frontier;
     const optimalSharpe = data.optimal_sharpe;
     const optimalMinVar = data.optimal_min_variance;
+    const randomPortfolios = data.random_portfolios;
+    
+    // Create scatter plot of random portfolios, drawn behind the frontier
+    const trace0 = {
+        x: randomPortfolios.volatilities,
+        y: randomPortfolios.returns,
+        mode: 'markers',
+        type: 'scatter',
+        name: 'Random Portfolios',
+        marker: {
+            size: 5,
+            color: '#b0b0b0',
+            opacity: 0.5
+        },
+        text: randomPortfolios.sharpe_ratios.map(s => `Sharpe: ${s.toFixed(3)}`),
+        hovertemplate: 'Volatility: %{x:.2%}<br>Return: %{y:.2%}<br>%{text}<extra></extra>'
+    };
     
     // Create scatter plot for efficient frontier
     const trace1 = {
         x: frontier.volatilities,
         y: frontier.returns,
-        mode: 'markers',
+        mode: 'lines+markers',
         type: 'scatter',
-        name: 'Portfolios',
+        name: 'Efficient Frontier',
+        line: { color: '#888', width: 2 },
         marker: {
             size: 8,
             color: frontier.sharpe_ratios,
@@ -233,7 +251,7 @@ function displayEfficientFrontier(data) {
         paper_bgcolor: 'white'
     };
     
-    Plotly.newPlot('frontierChart', [trace1, trace2, trace3], layout, {responsive: true});
+    Plotly.newPlot('frontierChart', [trace0, trace1, trace2, trace3], layout, {responsive: true});
     
     // Show frontier section
     document.getElementById('frontierResults').style.display = 'block';